@@ -47,6 +47,22 @@ public enum KeyboardLayout: String, CaseIterable {
             return "keyboard_\(rawValue).bin"
         }
     }
+
+    /// Filename for the bundle containing all layouts
+    static let bundleFilename = "keyboard_layouts.bin"
+
+    /// Slot of this layout in the bundle's offsets table
+    /// (must match the LAYOUTS order in scripts/generate_keyboard_layout.py)
+    var bundleSlot: Int? {
+        switch self {
+        case .qwerty: return 0
+        case .azerty: return 1
+        case .qwertz: return 2
+        case .dvorak: return 3
+        case .colemak: return 4
+        case .none: return nil
+        }
+    }
 }
 
 // MARK: - MMapKeyboardLayout
@@ -55,18 +71,36 @@ public enum KeyboardLayout: String, CaseIterable {
 ///
 /// Binary format:
 /// - Header: "KYBD" (4 bytes magic) + version (1 byte)
-/// - Distance matrix: 26x26 bytes for lowercase letters a-z
-///   - Value at [i][j] = keyboard distance from letter i to letter j
+/// - Distance matrix for lowercase letters a-z, cell [i][j] = keyboard distance
+///   from letter i to letter j
 ///   - 0 = same key
 ///   - 1 = directly adjacent (ring 1)
 ///   - 2 = distance 2 away (ring 2)
 ///   - 255 = far away / not related
+///
+/// Version 1 stores the matrix as 26x26 bytes. Version 2 packs it at 2 bits per
+/// cell (4 cells per byte, first cell in the lowest bits, far away encoded as 3),
+/// shrinking the matrix to 169 bytes.
+///
+/// Bundle format (`keyboard_layouts.bin`, all layouts in one file):
+/// - Header: "KBLS" (4 bytes magic) + version (1 byte) + slot count (1 byte)
+/// - Offsets: UInt32 little-endian per slot, indexed by `KeyboardLayout.bundleSlot`
+///   (0 = layout not included)
+/// - Distance matrices in the format above, without the per-file header
 public class MMapKeyboardLayout {
     private static let magic = Data("KYBD".utf8)
+    private static let bundleMagic = Data("KBLS".utf8)
     private static let headerSize = 5  // 4 bytes magic + 1 byte version
-    private static let matrixSize = 26 * 26  // 676 bytes
+    private static let bundleHeaderSize = 6  // 4 bytes magic + 1 byte version + 1 byte slot count
+    private static let matrixSize = 26 * 26  // 676 bytes (version 1)
+    private static let packedMatrixSize = (26 * 26 + 3) / 4  // 169 bytes (version 2)
+
+    /// Decoded distance for each 2-bit code in a version 2 matrix
+    private static let packedDistances: [UInt8] = [0, 1, 2, 255]
 
     private var data: Data?
+    private var version: UInt8 = 0
+    private var matrixOffset = 0
     private let layout: KeyboardLayout
 
     /// Create a keyboard layout handler for the specified layout.
@@ -78,6 +112,9 @@ public class MMapKeyboardLayout {
 
     /// Load the keyboard layout from a binary file.
     ///
+    /// Accepts either a single-layout file or a `keyboard_layouts.bin` bundle,
+    /// in which case the matrix for this layout is selected from the bundle.
+    ///
     /// - Parameter path: Path to the .bin file
     /// - Returns: true if loaded successfully
     @discardableResult
@@ -92,21 +129,36 @@ public class MMapKeyboardLayout {
             let fileData = try Data(contentsOf: path, options: .mappedIfSafe)
 
             // Validate header
-            guard fileData.count >= Self.headerSize + Self.matrixSize else {
+            guard fileData.count >= Self.headerSize else {
                 return false
             }
 
-            // Check magic bytes
-            guard fileData.prefix(4) == Self.magic else {
+            // Check magic bytes and locate the matrix
+            let matrixOffset: Int
+            if fileData.prefix(4) == Self.magic {
+                matrixOffset = Self.headerSize
+            } else if fileData.prefix(4) == Self.bundleMagic {
+                guard let offset = bundleMatrixOffset(in: fileData) else {
+                    return false
+                }
+                matrixOffset = offset
+            } else {
                 return false
             }
 
-            // Check version
+            // Check version and matrix size
             let version = fileData[4]
-            guard version == 1 else {
+            switch version {
+            case 1:
+                guard fileData.count >= matrixOffset + Self.matrixSize else { return false }
+            case 2:
+                guard fileData.count >= matrixOffset + Self.packedMatrixSize else { return false }
+            default:
                 return false
             }
 
+            self.version = version
+            self.matrixOffset = matrixOffset
             self.data = fileData
             return true
         } catch {
@@ -116,16 +168,44 @@ public class MMapKeyboardLayout {
 
     /// Load the keyboard layout from a directory containing layout files.
     ///
-    /// - Parameter directory: Directory containing keyboard_*.bin files
+    /// Uses the `keyboard_layouts.bin` bundle if it includes this layout,
+    /// otherwise the per-layout `keyboard_<layout>.bin` file.
+    ///
+    /// - Parameter directory: Directory containing keyboard layout .bin files
     /// - Returns: true if loaded successfully
     @discardableResult
     public func loadFromDirectory(_ directory: URL) -> Bool {
         guard layout != .none else { return true }
 
+        let bundlePath = directory.appendingPathComponent(KeyboardLayout.bundleFilename)
+        if FileManager.default.fileExists(atPath: bundlePath.path), load(from: bundlePath) {
+            return true
+        }
+
         let path = directory.appendingPathComponent(layout.filename)
         return load(from: path)
     }
 
+    /// Find this layout's matrix offset in a bundle file, or nil if it is not included.
+    private func bundleMatrixOffset(in fileData: Data) -> Int? {
+        guard fileData.count >= Self.bundleHeaderSize,
+              let slot = layout.bundleSlot,
+              slot < Int(fileData[5]) else {
+            return nil
+        }
+
+        let position = Self.bundleHeaderSize + slot * 4
+        guard position + 4 <= fileData.count else {
+            return nil
+        }
+
+        var offset = 0
+        for i in 0..<4 {
+            offset |= Int(fileData[position + i]) << (8 * i)
+        }
+        return offset > 0 ? offset : nil
+    }
+
     /// Get the keyboard distance between two characters.
     ///
     /// - Parameters:
@@ -146,7 +226,17 @@ public class MMapKeyboardLayout {
         }
 
         // Read from matrix
-        let offset = Self.headerSize + (fromIndex * 26) + toIndex
+        let cell = (fromIndex * 26) + toIndex
+        if version == 2 {
+            let offset = matrixOffset + (cell >> 2)
+            guard offset < data.count else {
+                return 255
+            }
+            let code = (data[offset] >> UInt8((cell & 3) * 2)) & 0b11
+            return Int(Self.packedDistances[Int(code)])
+        }
+
+        let offset = matrixOffset + cell
         guard offset < data.count else {
             return 255
         }
@@ -206,6 +296,8 @@ public class MMapKeyboardLayout {
     /// Close the layout and release resources.
     public func close() {
         data = nil
+        version = 0
+        matrixOffset = 0
     }
 }
 
@@ -487,7 +487,9 @@ struct SuggestionScorer {
 /// - Word index: [offset: 4 bytes] * num_words (points into data section)
 /// - Data section: [word_len: 1 byte][word: variable UTF-8][count: 8 bytes (UInt64)] * num_words
 ///
-/// Words are stored sorted alphabetically for binary search.
+/// Words are stored sorted alphabetically for binary search. All integers are
+/// little-endian regardless of the host; on little-endian devices the
+/// `littleEndian:` conversions compile to no-ops.
 public class MMapDictionary {
     private static let headerSize = 4  // num_words
     private static let indexEntrySize = 4  // offset
@@ -567,6 +569,13 @@ public class MMapDictionary {
             numWords = Int(readUInt32(from: data, at: 0))
             dataStart = Self.headerSize + (numWords * Self.indexEntrySize)
 
+            // The index must fit in the file (catches truncated or byte-swapped files)
+            guard dataStart <= data.count else {
+                self.data = nil
+                numWords = 0
+                return false
+            }
+
             return true
         } catch {
             return false
@@ -773,6 +782,7 @@ public class MMapDictionary {
 ///   - [key_len: 1 byte][key: variable UTF-8][num_suggestions: 2 bytes (UInt16)][suggestion_indices: 4 bytes each (UInt32)]
 ///
 /// Keys are read from mmap during binary search - not loaded into memory.
+/// All integers are little-endian regardless of the host.
 public class MMapDeletes {
     private let filePath: URL
     private var data: Data?
@@ -852,6 +862,13 @@ public class MMapDeletes {
             numEntries = Int(readUInt32(from: data, at: 0))
             dataStart = 4 + (numEntries * 4)
 
+            // The index must fit in the file (catches truncated or byte-swapped files)
+            guard dataStart <= data.count else {
+                self.data = nil
+                numEntries = 0
+                return false
+            }
+
             return true
         } catch {
             return false
@@ -994,7 +1011,7 @@ public class MMapDeletes {
 ///     prefixLength: 7,
 ///     keyboardLayout: .qwerty
 /// )
-/// // Load keyboard layout from directory containing keyboard_qwerty.bin
+/// // Load keyboard layout from directory containing keyboard_layouts.bin
 /// spellChecker.loadKeyboardLayout(from: keyboardLayoutDir)
 /// ```
 public class LowMemorySymSpell {
@@ -1318,8 +1335,9 @@ public class LowMemorySymSpell {
 
     /// Load keyboard layout from a directory containing layout files.
     ///
-    /// The directory should contain files like `keyboard_qwerty.bin`, `keyboard_azerty.bin`, etc.
-    /// The appropriate file is selected based on the `keyboardLayout` set during initialization.
+    /// The directory should contain the `keyboard_layouts.bin` bundle, or per-layout files like
+    /// `keyboard_qwerty.bin`, `keyboard_azerty.bin`, etc.
+    /// The appropriate layout is selected based on the `keyboardLayout` set during initialization.
     ///
     /// - Parameter directory: Directory containing keyboard layout .bin files
     /// - Returns: true if keyboard layout was loaded successfully
@@ -68,8 +68,9 @@ public class SymSpell {
 
     /// Load keyboard layout from a directory containing layout files.
     ///
-    /// The directory should contain files like `keyboard_qwerty.bin`, `keyboard_azerty.bin`, etc.
-    /// The appropriate file is selected based on the `keyboardLayout` set during initialization.
+    /// The directory should contain the `keyboard_layouts.bin` bundle, or per-layout files like
+    /// `keyboard_qwerty.bin`, `keyboard_azerty.bin`, etc.
+    /// The appropriate layout is selected based on the `keyboardLayout` set during initialization.
     ///
     /// - Parameter directory: Directory containing keyboard layout .bin files
     /// - Returns: true if keyboard layout was loaded successfully
@@ -36,6 +36,20 @@ final class LowMemorySymSpellTests: XCTestCase {
         dict.close()
     }
 
+    func testMMapDictionaryRejectsByteSwappedHeader() throws {
+        let dictPath = tempDir.appendingPathComponent("words.bin")
+        let dict = MMapDictionary(filePath: dictPath)
+        try dict.build(words: [("apple", 100), ("banana", 200)])
+
+        // Reverse the little-endian num_words as a big-endian writer would store it
+        var fileData = try Data(contentsOf: dictPath)
+        fileData.replaceSubrange(0..<4, with: fileData[0..<4].reversed())
+        try fileData.write(to: dictPath)
+
+        XCTAssertFalse(dict.open())
+        XCTAssertEqual(dict.numWords, 0)
+    }
+
     func testMMapDictionaryBinarySearch() throws {
         let dictPath = tempDir.appendingPathComponent("words.bin")
         let dict = MMapDictionary(filePath: dictPath)
@@ -752,6 +766,112 @@ final class LowMemorySymSpellTests: XCTestCase {
         keyboard.close()
     }
 
+    func testMMapKeyboardLayoutBundleContainsAllLayouts() throws {
+        let keyboardDir = URL(fileURLWithPath: #file)
+            .deletingLastPathComponent()
+            .deletingLastPathComponent()
+            .deletingLastPathComponent()
+            .appendingPathComponent("keyboard_layouts")
+
+        for layout in KeyboardLayout.allCases where layout != .none {
+            let keyboard = MMapKeyboardLayout(layout: layout)
+            XCTAssertTrue(keyboard.loadFromDirectory(keyboardDir), "Failed to load \(layout) from bundle")
+            XCTAssertEqual(keyboard.distance(from: "e", to: "e"), 0)
+            keyboard.close()
+        }
+
+        // Each layout reads its own matrix: 'a' and 'o' are neighbors only on Dvorak
+        let dvorak = MMapKeyboardLayout(layout: .dvorak)
+        XCTAssertTrue(dvorak.loadFromDirectory(keyboardDir))
+        XCTAssertTrue(dvorak.areAdjacent("a", "o"), "a and o should be adjacent on Dvorak")
+        dvorak.close()
+
+        let qwerty = MMapKeyboardLayout(layout: .qwerty)
+        XCTAssertTrue(qwerty.loadFromDirectory(keyboardDir))
+        XCTAssertFalse(qwerty.areAdjacent("a", "o"), "a and o should not be adjacent on QWERTY")
+        qwerty.close()
+    }
+
+    /// Build a version 1 keyboard layout file (header + one byte per cell of
+    /// the 26x26 matrix). Every letter is far from every other except the
+    /// given pairs, which are set in both directions.
+    private func makeVersion1Layout(
+        adjacent: [(Character, Character)],
+        distanceTwo: [(Character, Character)] = []
+    ) -> Data {
+        var matrix = [UInt8](repeating: 255, count: 26 * 26)
+        for i in 0..<26 {
+            matrix[i * 26 + i] = 0
+        }
+
+        func letterIndex(_ char: Character) -> Int {
+            return Int(char.asciiValue! - 97)  // 'a' = 97
+        }
+        for (pairs, distance) in [(adjacent, UInt8(1)), (distanceTwo, UInt8(2))] {
+            for (from, to) in pairs {
+                matrix[letterIndex(from) * 26 + letterIndex(to)] = distance
+                matrix[letterIndex(to) * 26 + letterIndex(from)] = distance
+            }
+        }
+
+        var fileData = Data("KYBD".utf8)
+        fileData.append(1)
+        fileData.append(contentsOf: matrix)
+        return fileData
+    }
+
+    func testMMapKeyboardLayoutFallsBackToLayoutFileWhenMissingFromBundle() throws {
+        let keyboardDir = URL(fileURLWithPath: #file)
+            .deletingLastPathComponent()
+            .deletingLastPathComponent()
+            .deletingLastPathComponent()
+            .appendingPathComponent("keyboard_layouts")
+        let shipped = try Data(contentsOf: keyboardDir.appendingPathComponent(KeyboardLayout.bundleFilename))
+
+        // Partial bundle: keep QWERTY (slot 0), clear the other slots' offsets
+        var bundle = shipped
+        for slot in 1..<Int(bundle[5]) {
+            let position = 6 + slot * 4
+            bundle.replaceSubrange(position..<(position + 4), with: Data(count: 4))
+        }
+        try bundle.write(to: tempDir.appendingPathComponent(KeyboardLayout.bundleFilename))
+
+        // Not in the bundle and no per-layout file
+        let azerty = MMapKeyboardLayout(layout: .azerty)
+        XCTAssertFalse(azerty.loadFromDirectory(tempDir))
+
+        // Version 1 keyboard_dvorak.bin next to the bundle: only 'a' and 'o' adjacent
+        try makeVersion1Layout(adjacent: [("a", "o")])
+            .write(to: tempDir.appendingPathComponent(KeyboardLayout.dvorak.filename))
+
+        let dvorak = MMapKeyboardLayout(layout: .dvorak)
+        XCTAssertTrue(dvorak.loadFromDirectory(tempDir), "Dvorak should fall back to keyboard_dvorak.bin")
+        XCTAssertTrue(dvorak.areAdjacent("a", "o"))
+        XCTAssertFalse(dvorak.areAdjacent("e", "u"))
+        dvorak.close()
+
+        // QWERTY is still read from the bundle
+        let qwerty = MMapKeyboardLayout(layout: .qwerty)
+        XCTAssertTrue(qwerty.loadFromDirectory(tempDir))
+        XCTAssertTrue(qwerty.areAdjacent("d", "s"))
+        qwerty.close()
+    }
+
+    func testMMapKeyboardLayoutLoadsUnpackedVersion1File() throws {
+        let path = tempDir.appendingPathComponent("keyboard_qwerty.bin")
+        try makeVersion1Layout(adjacent: [("d", "s")], distanceTwo: [("w", "d")]).write(to: path)
+
+        let keyboard = MMapKeyboardLayout(layout: .qwerty)
+        XCTAssertTrue(keyboard.load(from: path), "Failed to load version 1 keyboard layout")
+
+        XCTAssertEqual(keyboard.distance(from: "a", to: "a"), 0)
+        XCTAssertEqual(keyboard.distance(from: "d", to: "s"), 1)
+        XCTAssertEqual(keyboard.distance(from: "w", to: "d"), 2)
+        XCTAssertEqual(keyboard.distance(from: "q", to: "m"), 255)
+
+        keyboard.close()
+    }
+
     func testLowMemorySymSpellWithKeyboardLayout() throws {
         let keyboardDir = URL(fileURLWithPath: #file)
             .deletingLastPathComponent()
@@ -18,21 +18,87 @@ Generated files:
 - deletes.bin  - Delete variants index
 - bigrams.bin  - Bigram frequencies (optional)
 
+Output is byte-for-byte reproducible for the same inputs and options: every
+section is written in sorted key order and no Python hash() values are
+involved, so PYTHONHASHSEED does not affect the result.
+
+A .manifest.json next to the outputs records a hash of the input files and
+the build options. When it matches, the existing files are reused and the
+build is skipped (use --force to rebuild anyway).
+
 These files can be loaded by:
 - Swift: LowMemorySymSpell.loadPrebuilt(from: directory)
 - Python: LowMemorySymSpell.load_prebuilt()
 """
 
 import argparse
+import hashlib
+import json
 import os
 import sys
 from pathlib import Path
+from typing import Dict, Optional
 
 # Add script directory to path for local imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from low_memory_symspell import LowMemorySymSpell
 
+OUTPUT_FILES = ["words.bin", "deletes.bin", "bigrams.bin"]
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_VERSION = 1  # Bump when the output format or builder changes
+
+
+def file_digest(path: str) -> Optional[str]:
+    """Content hash of an input file, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def output_file_sizes(output_dir: str) -> Dict[str, int]:
+    """Sizes of the generated .bin files that exist in output_dir."""
+    sizes = {}
+    for name in OUTPUT_FILES:
+        try:
+            sizes[name] = os.stat(os.path.join(output_dir, name)).st_size
+        except FileNotFoundError:
+            continue
+    return sizes
+
+
+def build_key(args: argparse.Namespace) -> dict:
+    """Everything the generated files depend on."""
+    return {
+        "version": MANIFEST_VERSION,
+        "dictionary_sha": file_digest(args.dictionary),
+        "bigrams_sha": file_digest(args.bigrams),
+        "top_n": args.top_n,
+        "max_edit_distance": args.max_edit_distance,
+        "prefix_length": args.prefix_length,
+    }
+
+
+def is_cache_hit(manifest_path: str, key: dict, output_dir: str) -> bool:
+    """True if the manifest matches key and all recorded outputs are intact."""
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    file_sizes = manifest.get("file_sizes", {})
+    return (
+        manifest.get("key") == key
+        and "words.bin" in file_sizes
+        and "deletes.bin" in file_sizes
+        and output_file_sizes(output_dir) == file_sizes
+    )
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -71,6 +137,18 @@ def main():
         default=None,
         help="Only include top N most frequent words (reduces size)"
     )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for delete generation (default: 1). Only worth "
+             "raising on multi-core machines for very large dictionaries."
+    )
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Rebuild even if the outputs match the cached manifest"
+    )
     args = parser.parse_args()
     
     # Default dictionary paths (relative to this script)
@@ -102,13 +180,26 @@ def main():
     print(f"  Prefix length: {args.prefix_length}")
     if args.top_n:
         print(f"  Top N words: {args.top_n}")
+    print(f"  Workers: {args.workers}")
     print()
     
+    # Skip the build if the inputs and options are unchanged
+    manifest_path = os.path.join(args.output, MANIFEST_NAME)
+    key = build_key(args)
+    if not args.force and is_cache_hit(manifest_path, key, args.output):
+        print(f"✅ Cache hit: {args.output} is up to date ({MANIFEST_NAME}), skipping build.")
+        return 0
+    
+    # Invalidate the old manifest until the new build completes
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    
     # Build
     spell = LowMemorySymSpell(
         max_dictionary_edit_distance=args.max_edit_distance,
         prefix_length=args.prefix_length,
         data_dir=args.output,
+        build_workers=args.workers,
     )
     
     if args.top_n:
@@ -130,31 +221,34 @@ def main():
     success = spell.load_bigram_dictionary(args.bigrams)
     if not success:
         print(f"  ⚠ Failed to load bigrams (optional)")
+        # Don't ship (or cache) bigrams.bin left over from an earlier build
+        stale_bigrams = os.path.join(args.output, "bigrams.bin")
+        if os.path.exists(stale_bigrams):
+            os.remove(stale_bigrams)
     else:
         print(f"  ✓ Loaded {spell.bigram_count:,} bigrams")
     
     # Show file sizes
     print(f"\nGenerated files:")
-    for name in ["words.bin", "deletes.bin", "bigrams.bin"]:
-        path = os.path.join(args.output, name)
-        if os.path.exists(path):
-            size_kb = os.path.getsize(path) / 1024
-            size_mb = size_kb / 1024
-            if size_mb >= 1:
-                print(f"  {name}: {size_mb:.1f} MB")
-            else:
-                print(f"  {name}: {size_kb:.1f} KB")
-    
-    total_size = sum(
-        os.path.getsize(os.path.join(args.output, f))
-        for f in ["words.bin", "deletes.bin", "bigrams.bin"]
-        if os.path.exists(os.path.join(args.output, f))
-    )
+    file_sizes = output_file_sizes(args.output)
+    for name, size in file_sizes.items():
+        size_kb = size / 1024
+        size_mb = size_kb / 1024
+        if size_mb >= 1:
+            print(f"  {name}: {size_mb:.1f} MB")
+        else:
+            print(f"  {name}: {size_kb:.1f} KB")
+    
+    total_size = sum(file_sizes.values())
     print(f"\n  Total: {total_size / (1024*1024):.1f} MB")
     
     # Cleanup (close mmap files)
     spell.close()
     
+    # Record the inputs and options these files were built from
+    with open(manifest_path, "w") as f:
+        json.dump({"key": key, "file_sizes": file_sizes}, f, indent=2)
+    
     print(f"\n✅ Done! Copy {args.output}/*.bin to your iOS app bundle.")
     print(f"   At runtime, use: LowMemorySymSpell(data_dir='path/to/files')")
     
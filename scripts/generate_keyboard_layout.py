@@ -7,28 +7,57 @@ them as compact binary files that can be loaded by the Swift LowMemorySymSpell
 implementation.
 
 Usage:
-    python scripts/generate_keyboard_layout.py --layout qwerty --output ./keyboard_layouts
-
-Binary format:
+    python scripts/generate_keyboard_layout.py --output ./keyboard_layouts
+    python scripts/generate_keyboard_layout.py --layout qwerty --split --output ./keyboard_layouts
+
+By default all layouts are written to a single keyboard_layouts.bin bundle so
+the runtime maps one file and jumps to a layout by index. --split writes one
+keyboard_<layout>.bin file per layout instead (useful for debugging). The
+bundle always holds every layout; --layout only selects the layouts written
+with --split and printed with --verbose.
+
+Bundle format (keyboard_layouts.bin):
+    - Header: "KBLS" (4 bytes magic) + version (1 byte) + slot count (1 byte)
+    - Offsets: one little-endian uint32 per slot, in LAYOUTS order
+      (0 = layout not included)
+    - Packed distance matrices (see below, without the per-file header)
+
+Single layout format (version 2):
     - Header: "KYBD" (4 bytes magic) + version (1 byte)
-    - Distance matrix: 26x26 bytes for lowercase letters a-z
-      - Value at [i][j] = keyboard distance from letter i to letter j
+    - Distance matrix: 26x26 cells for lowercase letters a-z, packed 2 bits
+      per cell (4 cells per byte, first cell in the lowest bits)
+      - Cell [i][j] = keyboard distance from letter i to letter j
       - 0 = same key
       - 1 = directly adjacent (ring 1)
       - 2 = distance 2 away (ring 2)
-      - 255 = far away / not related
+      - 3 = far away / not related (decoded as 255)
 
-Total file size: 681 bytes per layout.
+Total file size: 174 bytes per layout (bundle of all five: 871 bytes).
 """
 
 import argparse
+import functools
 import os
 import struct
-from typing import Dict, List, Set, Tuple
+from typing import List, Tuple
+
+import numpy as np
 
 # Magic header for keyboard layout files
 MAGIC = b"KYBD"
-VERSION = 1
+BUNDLE_MAGIC = b"KBLS"
+BUNDLE_FILENAME = "keyboard_layouts.bin"
+VERSION = 2
+
+# 2-bit codes for each distance value (255 = far away maps to 3)
+PACKED_CODES = np.zeros(256, dtype=np.uint8)
+PACKED_CODES[[0, 1, 2, 255]] = [0, 1, 2, 3]
+
+# Row offsets to simulate keyboard stagger (in half-key units)
+# Top row: no offset
+# Middle row: offset by 0.5 keys (1 half-key)
+# Bottom row: offset by 1 key (2 half-keys)
+ROW_OFFSETS = (0, 1, 3)
 
 # QWERTY keyboard layout - each row is a list of keys
 QWERTY_ROWS = [
@@ -65,7 +94,8 @@ COLEMAK_ROWS = [
     list("zxcvbkm"),
 ]
 
-# Layout name to rows mapping
+# Layout name to rows mapping. The order defines the bundle slots and must
+# match KeyboardLayout.bundleSlot in KeyboardLayout.swift.
 LAYOUTS = {
     "qwerty": QWERTY_ROWS,
     "azerty": AZERTY_ROWS,
@@ -75,121 +105,134 @@ LAYOUTS = {
 }
 
 
-def get_key_positions(rows: List[List[str]]) -> Dict[str, Tuple[int, int]]:
+@functools.lru_cache(maxsize=None)
+def get_key_positions(rows: Tuple[Tuple[str, ...], ...]) -> Tuple[np.ndarray, np.ndarray]:
     """
     Get (row, col) position for each key.
 
+    Returns two read-only length-26 arrays (row_pos, col_pos) indexed by
+    ord(key) - ord('a'). Letters missing from the layout are set to -1, and
+    keys other than a-z (punctuation, digits, ...) are ignored. Results are
+    memoized, so rows must be passed as a tuple of tuples.
+
     Handles staggered keyboard layout - rows are offset by ~0.5 keys.
     We use half-key precision internally: col is doubled for accurate distance.
     """
-    positions = {}
-
-    # Row offsets to simulate keyboard stagger (in half-key units)
-    # Top row: no offset
-    # Middle row: offset by 0.5 keys (1 half-key)
-    # Bottom row: offset by 1 key (2 half-keys)
-    row_offsets = [0, 1, 3]
+    row_pos = np.full(26, -1, dtype=np.int16)
+    col_pos = np.full(26, -1, dtype=np.int16)
 
     for row_idx, row in enumerate(rows):
-        offset = row_offsets[row_idx] if row_idx < len(row_offsets) else row_idx * 2
+        offset = ROW_OFFSETS[row_idx] if row_idx < len(ROW_OFFSETS) else row_idx * 2
         for col_idx, key in enumerate(row):
+            # Only lowercase letters have a slot in the matrix
+            if not 'a' <= key <= 'z':
+                continue
             # Use half-key precision: multiply col by 2
-            positions[key] = (row_idx * 2, col_idx * 2 + offset)
+            letter = ord(key) - ord('a')
+            row_pos[letter] = row_idx * 2
+            col_pos[letter] = col_idx * 2 + offset
 
-    return positions
+    # Cached arrays are shared between callers
+    row_pos.flags.writeable = False
+    col_pos.flags.writeable = False
+    return row_pos, col_pos
 
 
-def compute_distance_matrix(rows: List[List[str]], max_distance: int = 2) -> List[List[int]]:
+def compute_distance_matrix(rows: List[List[str]], max_distance: int = 2) -> np.ndarray:
     """
     Compute keyboard distance matrix for all letter pairs.
 
-    Returns 26x26 matrix where matrix[i][j] is the keyboard distance
+    Returns 26x26 uint8 matrix where matrix[i][j] is the keyboard distance
     from letter chr(ord('a') + i) to letter chr(ord('a') + j).
 
     Distance is computed using Chebyshev distance (max of row/col diff)
     with keyboard stagger accounted for.
     """
-    positions = get_key_positions(rows)
+    row_pos, col_pos = get_key_positions(tuple(tuple(row) for row in rows))
 
-    # Initialize 26x26 matrix with 255 (far away)
-    matrix = [[255 for _ in range(26)] for _ in range(26)]
+    # Chebyshev distance in half-key units for every pair at once
+    # (accounts for diagonal adjacency)
+    row_diff = np.abs(row_pos[:, None] - row_pos[None, :])
+    col_diff = np.abs(col_pos[:, None] - col_pos[None, :])
+    chebyshev = np.maximum(row_diff, col_diff)
 
-    for i in range(26):
-        char_i = chr(ord('a') + i)
-
-        for j in range(26):
-            char_j = chr(ord('a') + j)
-
-            if i == j:
-                # Same key
-                matrix[i][j] = 0
-            elif char_i in positions and char_j in positions:
-                pos_i = positions[char_i]
-                pos_j = positions[char_j]
-
-                # Compute distance using Chebyshev distance
-                # (accounts for diagonal adjacency)
-                row_diff = abs(pos_i[0] - pos_j[0])
-                col_diff = abs(pos_i[1] - pos_j[1])
-
-                # Convert from half-key units to key units
-                # Adjacent keys differ by ~2 half-key units
-                chebyshev = max(row_diff, col_diff)
-
-                if chebyshev <= 2:
-                    # Distance 1: immediately adjacent
-                    matrix[i][j] = 1
-                elif chebyshev <= 4:
-                    # Distance 2: one key away
-                    matrix[i][j] = 2
-                else:
-                    # Far away
-                    matrix[i][j] = 255
-            # else: not on keyboard, stays 255
+    # Adjacent keys differ by ~2 half-key units:
+    # <= 2 is ring 1 (immediately adjacent), <= 4 is ring 2 (one key away)
+    matrix = np.full((26, 26), 255, dtype=np.uint8)
+    matrix[chebyshev <= 4] = 2
+    matrix[chebyshev <= 2] = 1
+
+    # Letters not on the keyboard are far from everything
+    missing = row_pos < 0
+    matrix[missing, :] = 255
+    matrix[:, missing] = 255
+
+    # Same key
+    np.fill_diagonal(matrix, 0)
 
     return matrix
 
 
-def get_adjacent_keys(rows: List[List[str]]) -> Dict[str, Set[str]]:
-    """Get set of adjacent keys for each key (for debugging/verification)."""
-    matrix = compute_distance_matrix(rows)
-    adjacent = {}
+def pack_distance_matrix(matrix: np.ndarray) -> np.ndarray:
+    """
+    Pack 26x26 distance matrices into 2 bits per cell.
 
-    for i in range(26):
-        char_i = chr(ord('a') + i)
-        neighbors = set()
-        for j in range(26):
-            if matrix[i][j] == 1:
-                neighbors.add(chr(ord('a') + j))
-        adjacent[char_i] = neighbors
+    Accepts a single matrix or a stack of shape (N, 26, 26). Cells are taken
+    in row-major order; cell k lands in byte k // 4 at bit offset
+    (k % 4) * 2. Returns 169 uint8 bytes per matrix, shaped (169,) or (N, 169).
+    """
+    # 26 * 26 cells is a multiple of 4, so every byte is full
+    codes = PACKED_CODES[matrix].reshape(*matrix.shape[:-2], -1, 4)
+    packed = codes[..., 0] | (codes[..., 1] << 2) | (codes[..., 2] << 4) | (codes[..., 3] << 6)
+    return packed.astype(np.uint8, copy=False)
 
-    return adjacent
 
+# Distance matrices for every known layout, computed once at import time.
+# Read-only since they are shared by all callers.
+LAYOUT_MATRICES = {name: compute_distance_matrix(rows) for name, rows in LAYOUTS.items()}
+for _matrix in LAYOUT_MATRICES.values():
+    _matrix.flags.writeable = False
+del _matrix
 
-def write_layout_file(output_path: str, rows: List[List[str]]) -> None:
-    """Write keyboard layout to binary file."""
-    matrix = compute_distance_matrix(rows)
 
+def write_layout_file(output_path: str, matrix: np.ndarray) -> None:
+    """Write keyboard layout (header + packed distance matrix) to binary file."""
     with open(output_path, 'wb') as f:
-        # Write header
-        f.write(MAGIC)
-        f.write(struct.pack('B', VERSION))
-
-        # Write 26x26 distance matrix
-        for row in matrix:
-            f.write(bytes(row))
+        # Header and matrix in a single write
+        f.write(MAGIC + struct.pack('B', VERSION) + pack_distance_matrix(matrix).tobytes())
 
     print(f"  Written {os.path.getsize(output_path)} bytes to {output_path}")
 
 
-def print_adjacency_info(layout_name: str, rows: List[List[str]]) -> None:
-    """Print adjacency information for debugging."""
-    adjacent = get_adjacent_keys(rows)
+def write_layout_bundle(output_path: str, layout_names: List[str], matrices: np.ndarray) -> None:
+    """Write a stack of keyboard layouts to a single bundle file."""
+    header_size = len(BUNDLE_MAGIC) + 2 + 4 * len(LAYOUTS)
+    # All layouts packed in one vectorized call, one row per layout
+    packed = pack_distance_matrix(matrices)
+    block_size = packed.shape[1]
+
+    offsets = dict.fromkeys(LAYOUTS, 0)
+    for i, name in enumerate(layout_names):
+        offsets[name] = header_size + i * block_size
 
+    header = (
+        BUNDLE_MAGIC
+        + struct.pack('<BB', VERSION, len(LAYOUTS))
+        + struct.pack(f'<{len(LAYOUTS)}I', *offsets.values())
+    )
+    with open(output_path, 'wb') as f:
+        # Header, offsets table and all matrices in a single write
+        f.write(header + packed.tobytes())
+
+    print(f"  Written {os.path.getsize(output_path)} bytes to {output_path}")
+
+
+def print_adjacency_info(layout_name: str, matrix: np.ndarray) -> None:
+    """Print adjacency information (distance 1) for debugging."""
     print(f"\n{layout_name.upper()} adjacency (distance 1):")
-    for key in sorted(adjacent.keys()):
-        neighbors = sorted(adjacent[key])
-        print(f"  {key}: {', '.join(neighbors)}")
+    for i in range(26):
+        neighbors = [chr(ord('a') + j) for j in np.where(matrix[i] == 1)[0]]
+        print(f"  {chr(ord('a') + i)}: {', '.join(neighbors)}")
 
 
 def main():
@@ -212,6 +255,11 @@ def main():
         action="store_true",
         help="Print adjacency information"
     )
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        help=f"Write one keyboard_<layout>.bin per layout instead of a single {BUNDLE_FILENAME}"
+    )
     args = parser.parse_args()
 
     # Create output directory
@@ -224,16 +272,26 @@ def main():
     print()
 
     for layout_name in layouts_to_generate:
-        rows = LAYOUTS[layout_name]
-        output_path = os.path.join(args.output, f"keyboard_{layout_name}.bin")
-
+        matrix = LAYOUT_MATRICES[layout_name]
         print(f"Generating {layout_name}...")
-        write_layout_file(output_path, rows)
 
-        if args.verbose:
-            print_adjacency_info(layout_name, rows)
+        if args.split:
+            output_path = os.path.join(args.output, f"keyboard_{layout_name}.bin")
+            write_layout_file(output_path, matrix)
 
-    print(f"\nDone! Generated {len(layouts_to_generate)} layout file(s).")
+        if args.verbose:
+            print_adjacency_info(layout_name, matrix)
+
+    if args.split:
+        print(f"\nDone! Generated {len(layouts_to_generate)} layout file(s).")
+    else:
+        # The bundle always holds every layout so a partial run never drops slots
+        print(f"\nWriting bundle...")
+        layout_names = list(LAYOUTS.keys())
+        # All matrices as one (N, 26, 26) stack, packed in a single call
+        matrices = np.stack([LAYOUT_MATRICES[name] for name in layout_names])
+        write_layout_bundle(os.path.join(args.output, BUNDLE_FILENAME), layout_names, matrices)
+        print(f"\nDone! Generated {len(layout_names)} layout(s) in {BUNDLE_FILENAME}.")
     print(f"\nUsage in Swift:")
     print(f"  let symSpell = LowMemorySymSpell(")
     print(f"      maxEditDistance: 2,")
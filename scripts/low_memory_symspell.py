@@ -5,20 +5,27 @@ This module provides a memory-efficient alternative to the standard SymSpell
 by storing dictionaries in memory-mapped binary files instead of RAM.
 
 Requirements:
-    pip install symspellpy
+    pip install symspellpy numpy
 
 Or if you have the symspellpy repo as a sibling directory, it will use that.
 """
 
+import codecs
 import gc
+import itertools
 import mmap
 import os
+import re
 import struct
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, List, BinaryIO
 
+import numpy as np
+
 # Try to import from symspellpy package, or from sibling repo
 try:
     from symspellpy import Verbosity
@@ -41,6 +48,147 @@ except ImportError:
         )
 
 
+@contextmanager
+def _mmap_for_writing(path: str, size: int):
+    """
+    Create a file of exactly `size` bytes and map it writable.
+    
+    Records are written straight into the mapping (via a NumPy view), so the
+    OS flushes the final file contiguously with no userspace copy.
+    """
+    with open(path, 'w+b') as f:
+        os.ftruncate(f.fileno(), size)
+        mm = mmap.mmap(f.fileno(), size)
+        try:
+            yield mm
+            mm.flush()
+        finally:
+            mm.close()
+
+
+def _key_words(keys: np.ndarray) -> np.ndarray:
+    """
+    Convert fixed-width byte keys to an (n, words) matrix of uint64s.
+    
+    Keys are zero-padded to a multiple of 8 bytes and each word holds the
+    big-endian value of its bytes, so comparing rows word by word orders
+    them exactly like the bytes, and NumPy sorts integers instead of
+    strings. The words are byteswapped in place into native order, which
+    lexsort needs to avoid another copy.
+    """
+    num_words = max(1, -(-keys.dtype.itemsize // 8))
+    words = keys.astype(f'S{num_words * 8}').view('>u8').reshape(len(keys), num_words)
+    words.byteswap(inplace=True)
+    return words.view(words.dtype.newbyteorder())
+
+
+def _generate_delete_pairs(
+    prefixes: np.ndarray, max_edit_distance: int
+) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """
+    Generate every delete variant (0..max_edit_distance deletions) of each prefix.
+    
+    `prefixes` is a fixed-width unicode array. Prefixes are grouped by length
+    and viewed as (n, length) matrices of characters (bytes for ASCII words,
+    code points otherwise). For each combination of kept positions a single
+    fancy-index gather produces that variant for the whole group, so no
+    delete string is ever built by slicing and concatenation. Duplicate
+    variants of the same word (e.g. "helo" from either "l" of "hello") are
+    dropped per row.
+    
+    Returns parallel lists of blocks of UTF-8 keys and uint32 indices into
+    `prefixes`. Each key block is either narrow (no wider than the prefix
+    length in bytes) or wide (every key longer than that), so blocks can be
+    concatenated per width by _partition_delete_pairs without widening the
+    ASCII keys to fit a few multi-byte ones.
+    """
+    lengths = np.char.str_len(prefixes)
+    narrow_width = prefixes.dtype.itemsize // 4
+    key_blocks: list[np.ndarray] = []
+    id_blocks: list[np.ndarray] = []
+    
+    for length in np.unique(lengths).tolist():
+        group_ids = np.flatnonzero(lengths == length).astype('<u4')
+        words = np.ascontiguousarray(prefixes[group_ids])
+        codes = words.view(np.uint32).reshape(len(group_ids), -1)[:, :length]
+        row_is_ascii = (codes < 128).all(axis=1)
+        
+        for ascii_rows in (True, False):
+            subset_ids = group_ids[row_is_ascii == ascii_rows]
+            if not len(subset_ids):
+                continue
+            
+            # ASCII words are gathered directly as bytes; the rest as code
+            # points, which are UTF-8 encoded afterwards
+            subset = codes[row_is_ascii == ascii_rows]
+            if ascii_rows:
+                subset = subset.astype(np.uint8)
+            kind = 'S' if ascii_rows else 'U'
+            
+            for num_deletes in range(min(max_edit_distance, length) + 1):
+                kept_len = length - num_deletes
+                if kept_len == 0:
+                    # Everything deleted: the empty string, once per word
+                    key_blocks.append(np.zeros(len(subset_ids), dtype='S1'))
+                    id_blocks.append(subset_ids)
+                    continue
+                
+                kept = np.array(
+                    list(itertools.combinations(range(length), kept_len)), dtype=np.intp
+                )
+                variants = np.ascontiguousarray(subset[:, kept])
+                variants = variants.view(f'{kind}{kept_len}').reshape(len(subset_ids), len(kept))
+                
+                # Drop duplicate variants within each word
+                variants.sort(axis=1)
+                unique = np.ones(variants.shape, dtype=bool)
+                unique[:, 1:] = variants[:, 1:] != variants[:, :-1]
+                
+                block = variants[unique]
+                block_ids = np.broadcast_to(subset_ids[:, None], variants.shape)[unique]
+                if ascii_rows:
+                    key_blocks.append(block)
+                    id_blocks.append(block_ids)
+                    continue
+                
+                # Keep the encoded keys that still fit the narrow width apart
+                # from the longer ones
+                block = np.char.encode(block, 'utf-8')
+                fits = np.char.str_len(block) <= narrow_width
+                key_blocks.append(block[fits].astype(f'S{min(block.itemsize, narrow_width)}'))
+                id_blocks.append(block_ids[fits])
+                if not fits.all():
+                    key_blocks.append(block[~fits])
+                    id_blocks.append(block_ids[~fits])
+    
+    return key_blocks, id_blocks
+
+
+def _partition_delete_pairs(
+    key_blocks: list[np.ndarray], id_blocks: list[np.ndarray], narrow_width: int
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Concatenate delete pair blocks into a narrow and a wide partition.
+    
+    Blocks no wider than `narrow_width` bytes form the first partition, the
+    rest (whose keys are all longer than that) the second, as expected by
+    MMapDeletes.build(). The block lists are emptied once merged.
+    """
+    partitions = []
+    for is_narrow in (True, False):
+        keys = [block for block in key_blocks if (block.itemsize <= narrow_width) == is_narrow]
+        ids = [block for key_block, block in zip(key_blocks, id_blocks)
+               if (key_block.itemsize <= narrow_width) == is_narrow]
+        partitions.append((
+            np.concatenate([np.empty(0, dtype='S1')] + keys),
+            np.concatenate([np.empty(0, dtype='<u4')] + ids),
+        ))
+        del keys, ids
+    key_blocks.clear()
+    id_blocks.clear()
+    return partitions
+
+
 class MMapDictionary:
     """
     Memory-mapped dictionary for word frequencies.
@@ -50,7 +198,8 @@ class MMapDictionary:
     - Word index: [offset: 4 bytes] * num_words (points into data section)
     - Data section: [word_len: 1 byte][word: variable][count: 8 bytes] * num_words
     
-    Words are stored sorted for binary search.
+    Words are stored sorted for binary search. All integers are little-endian
+    regardless of the host, so the same files work on every platform.
     """
     
     HEADER_SIZE = 4  # num_words
@@ -70,33 +219,61 @@ class MMapDictionary:
         """Build the mmap file from a list of (word, count) pairs."""
         # Sort words alphabetically
         words.sort(key=lambda x: x[0])
-        self.num_words = len(words)
+        
+        keys = np.array([word.encode('utf-8') for word, _ in words], dtype='S')
+        counts = np.fromiter((count for _, count in words), dtype='<u8', count=len(words))
+        self._write_sorted(keys, counts)
+    
+    def build_arrays(self, keys: np.ndarray, counts: np.ndarray):
+        """
+        Build the mmap file from parallel arrays of UTF-8 keys and counts.
+        
+        Keys are stable-sorted bytewise, which matches sorting the decoded
+        strings, so no per-record Python objects are created.
+        """
+        key_words = _key_words(keys)
+        if key_words.shape[1] == 1:
+            order = np.argsort(key_words[:, 0], kind='stable')
+        else:
+            order = np.lexsort(key_words.T[::-1])
+        self._write_sorted(keys[order], counts[order])
+    
+    def _write_sorted(self, keys: np.ndarray, counts: np.ndarray):
+        """Write sorted keys and counts straight into the mapped output file."""
+        self.num_words = len(keys)
         
         # Calculate offsets
         self.data_start = self.HEADER_SIZE + (self.num_words * self.INDEX_ENTRY_SIZE)
         
-        with open(self.file_path, 'wb') as f:
-            # Write header
-            f.write(struct.pack('<I', self.num_words))
+        # word_len (1 byte) + word + count (8 bytes) per record
+        key_lens = np.char.str_len(keys).astype(np.int64)
+        record_sizes = 9 + key_lens
+        offsets = self.data_start + np.cumsum(record_sizes) - record_sizes
+        total_size = self.data_start + int(record_sizes.sum())
+        if total_size > 0xFFFFFFFF or (key_lens > 0xFF).any():
+            raise ValueError("dictionary exceeds the 32-bit offset / 8-bit word length format")
+        
+        key_bytes = keys.view(np.uint8).reshape(self.num_words, keys.dtype.itemsize)
+        count_bytes = counts.astype('<u8').view(np.uint8).reshape(self.num_words, 8)
+        count_pos = offsets + 1 + key_lens
+        
+        with _mmap_for_writing(self.file_path, total_size) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
             
-            # First pass: calculate offsets and write index
-            current_offset = self.data_start
-            offsets = []
-            for word, count in words:
-                offsets.append(current_offset)
-                # word_len (1 byte) + word + count (8 bytes)
-                current_offset += 1 + len(word.encode('utf-8')) + 8
+            # Write header and index
+            buf[0:4] = np.array([self.num_words], dtype='<u4').view(np.uint8)
+            buf[self.HEADER_SIZE:self.data_start] = offsets.astype('<u4').view(np.uint8)
             
-            # Write index
-            for offset in offsets:
-                f.write(struct.pack('<I', offset))
+            # Write data: [word_len][word][count]
+            buf[offsets] = key_lens
+            for j in range(keys.dtype.itemsize):
+                rows = key_lens > j
+                buf[offsets[rows] + 1 + j] = key_bytes[rows, j]
+            for j in range(8):
+                buf[count_pos + j] = count_bytes[:, j]
             
-            # Write data
-            for word, count in words:
-                word_bytes = word.encode('utf-8')
-                f.write(struct.pack('<B', len(word_bytes)))
-                f.write(word_bytes)
-                f.write(struct.pack('<Q', count))
+            # Release the buffer export before the mapping is closed
+            del buf
     
     def open(self):
         """Open the mmap file for reading."""
@@ -106,9 +283,17 @@ class MMapDictionary:
         self.file = open(self.file_path, 'rb')
         self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
         
-        # Read header
+        # Read header (a truncated or byte-swapped file fails here)
+        if len(self.mm) < self.HEADER_SIZE:
+            self.close()
+            return False
         self.num_words = struct.unpack('<I', self.mm[0:4])[0]
         self.data_start = self.HEADER_SIZE + (self.num_words * self.INDEX_ENTRY_SIZE)
+        if self.data_start > len(self.mm):
+            self.close()
+            self.num_words = 0
+            self.data_start = 0
+            return False
         
         return True
     
@@ -183,8 +368,12 @@ class MMapDeletes:
       - [key_len: 1 byte][key: variable][num_suggestions: 2 bytes][suggestion_indices: 4 bytes each]
     
     We do NOT load keys into memory - we read them from mmap during binary search.
+    All integers are little-endian regardless of the host.
     """
     
+    WRITE_BATCH = 1 << 16  # Entries scattered into the file per batch
+    RUN_BATCH = 1 << 20  # Sorted pairs compared per batch when finding runs
+    
     def __init__(self, file_path: str):
         self.file_path = file_path
         self.file: Optional[BinaryIO] = None
@@ -193,42 +382,149 @@ class MMapDeletes:
         self.index_start = 4  # After header
         self.data_start = 0
     
-    def build(self, deletes: dict[str, list[int]]):
-        """Build the mmap file from deletes dict."""
-        # Sort keys
-        sorted_keys = sorted(deletes.keys())
-        self.num_entries = len(sorted_keys)
+    def build(self, pairs: list):
+        """
+        Build the mmap file from (delete_key, word_index) pairs.
+        
+        `pairs` is a list of (keys, word_ids) tuples of parallel arrays, one
+        per key width partition (see _partition_delete_pairs). The builder
+        takes them out of the list, so once the caller has dropped its own
+        references each array is freed as soon as it has been used.
+        
+        Each partition is sorted by key and then word index, each run of
+        equal keys becomes one entry, and the partitions' entries are
+        interleaved in key order. All fields are scattered into the mapped
+        file with vectorized NumPy writes.
+        """
+        runs = []
+        while pairs:
+            runs.append(self._sorted_runs(pairs))
+        ranks = self._merged_ranks([unique_keys for unique_keys, _, _ in runs])
+        self.num_entries = sum(len(unique_keys) for unique_keys, _, _ in runs)
         
         # Calculate data start (after header + index)
         self.data_start = 4 + (self.num_entries * 4)
         
-        with open(self.file_path, 'wb') as f:
-            # Write header
-            f.write(struct.pack('<I', self.num_entries))
+        # key_len (1 byte) + key + num_suggestions (2 bytes) + 4 bytes per suggestion
+        entry_sizes = np.empty(self.num_entries, dtype=np.int64)
+        for (unique_keys, starts, word_ids), rank in zip(runs, ranks):
+            counts = np.diff(np.append(starts, len(word_ids)))
+            if (counts > 0xFFFF).any():
+                raise ValueError("deletes index exceeds the 32-bit offset / 16-bit count format")
+            entry_sizes[rank] = 3 + np.char.str_len(unique_keys) + 4 * counts
+        offsets = self.data_start + np.cumsum(entry_sizes) - entry_sizes
+        total_size = self.data_start + int(entry_sizes.sum())
+        del entry_sizes
+        if total_size > 0xFFFFFFFF:
+            raise ValueError("deletes index exceeds the 32-bit offset / 16-bit count format")
+        
+        with _mmap_for_writing(self.file_path, total_size) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
             
-            # First pass: calculate offsets
-            offsets = []
-            current_offset = self.data_start
-            for key in sorted_keys:
-                offsets.append(current_offset)
-                key_bytes = key.encode('utf-8')
-                num_suggestions = len(deletes[key])
-                current_offset += 1 + len(key_bytes) + 2 + (num_suggestions * 4)
+            # Write header and offset index
+            buf[0:4] = np.array([self.num_entries], dtype='<u4').view(np.uint8)
+            buf[4:self.data_start] = offsets.astype('<u4').view(np.uint8)
             
-            # Write offset index
-            for offset in offsets:
-                f.write(struct.pack('<I', offset))
+            for (unique_keys, starts, word_ids), rank in zip(runs, ranks):
+                self._write_entries(buf, offsets[rank], unique_keys, starts, word_ids)
             
-            # Write entries
-            for key in sorted_keys:
-                suggestions = deletes[key]
-                key_bytes = key.encode('utf-8')
-                
-                f.write(struct.pack('<B', len(key_bytes)))
-                f.write(key_bytes)
-                f.write(struct.pack('<H', len(suggestions)))
-                for idx in suggestions:
-                    f.write(struct.pack('<I', idx))
+            # Release the buffer export before the mapping is closed
+            del buf
+    
+    def _write_entries(
+        self,
+        buf: np.ndarray,
+        offsets: np.ndarray,
+        unique_keys: np.ndarray,
+        starts: np.ndarray,
+        word_ids: np.ndarray,
+    ):
+        """Scatter one partition's entries into the file at the given offsets."""
+        num_entries = len(unique_keys)
+        counts = np.diff(np.append(starts, len(word_ids)))
+        key_lens = np.char.str_len(unique_keys).astype(np.int64)
+        
+        width = unique_keys.dtype.itemsize
+        key_bytes = unique_keys.view(np.uint8).reshape(num_entries, width)
+        id_bytes = word_ids.view(np.uint8).reshape(len(word_ids), 4)
+        # Where each entry's suggestion indices begin, shifted so that adding
+        # 4 * (pair position in the partition) lands on that pair's slot
+        count_pos = offsets + 1 + key_lens
+        pair_base = count_pos + 2 - 4 * starts
+        
+        for lo in range(0, num_entries, self.WRITE_BATCH):
+            hi = min(lo + self.WRITE_BATCH, num_entries)
+            batch_offsets = offsets[lo:hi]
+            batch_lens = key_lens[lo:hi]
+            
+            # [key_len][key]
+            buf[batch_offsets] = batch_lens
+            for j in range(width):
+                rows = batch_lens > j
+                buf[batch_offsets[rows] + 1 + j] = key_bytes[lo:hi][rows, j]
+            
+            # [num_suggestions] (little-endian uint16)
+            batch_counts = counts[lo:hi]
+            buf[count_pos[lo:hi]] = batch_counts & 0xFF
+            buf[count_pos[lo:hi] + 1] = batch_counts >> 8
+            
+            # [suggestion_indices] (little-endian uint32 each)
+            first, last = starts[lo], starts[hi - 1] + batch_counts[-1]
+            dest = np.repeat(pair_base[lo:hi], batch_counts) + 4 * np.arange(first, last)
+            for b in range(4):
+                buf[dest + b] = id_bytes[first:last, b]
+    
+    @staticmethod
+    def _merged_ranks(partitions: list[np.ndarray]) -> list[np.ndarray]:
+        """
+        Position of each partition's unique keys in the merged key order.
+        
+        Partitions are sorted and ordered by width, and every key is longer
+        than the narrower partitions' width. Truncating the longer key of a
+        pair to the narrower width therefore decides the comparison, and a
+        tie means the shorter key is a prefix of the longer one, so it sorts
+        first. No key is ever widened.
+        """
+        ranks = []
+        for i, keys in enumerate(partitions):
+            rank = np.arange(len(keys), dtype=np.int64)
+            for j, other in enumerate(partitions):
+                if j < i:
+                    # Narrower keys equal to our truncated key are our prefixes
+                    rank += np.searchsorted(other, keys.astype(other.dtype), side='right')
+                elif j > i:
+                    rank += np.searchsorted(other.astype(keys.dtype), keys, side='left')
+            ranks.append(rank)
+        return ranks
+    
+    def _sorted_runs(self, pairs: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sort the (keys, word_ids) tuple taken from `pairs` by key, then index.
+        
+        Returns the unique keys, the start of each key's run and the word
+        indices in sorted order. Only the run starts' keys are gathered; no
+        fully sorted copy of the keys is made.
+        """
+        keys, word_ids = pairs.pop(0)
+        key_words = _key_words(keys)
+        
+        # lexsort's last key is the primary one: key words, then word index
+        order = np.lexsort((word_ids,) + tuple(key_words.T[::-1]))
+        
+        # Start of each run of equal keys, compared in batches
+        changed = np.ones(len(order), dtype=bool)
+        for lo in range(1, len(order), self.RUN_BATCH):
+            hi = min(lo + self.RUN_BATCH, len(order))
+            changed[lo:hi] = (
+                key_words[order[lo:hi]] != key_words[order[lo - 1:hi - 1]]
+            ).any(axis=1)
+        starts = np.flatnonzero(changed)
+        del key_words, changed
+        
+        unique_keys = keys[order[starts]]
+        del keys
+        word_ids = word_ids[order].astype('<u4', copy=False)
+        return unique_keys, starts, word_ids
     
     def open(self):
         """Open mmap file."""
@@ -238,9 +534,17 @@ class MMapDeletes:
         self.file = open(self.file_path, 'rb')
         self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
         
-        # Read header
+        # Read header (a truncated or byte-swapped file fails here)
+        if len(self.mm) < 4:
+            self.close()
+            return False
         self.num_entries = struct.unpack('<I', self.mm[0:4])[0]
         self.data_start = 4 + (self.num_entries * 4)
+        if self.data_start > len(self.mm):
+            self.close()
+            self.num_entries = 0
+            self.data_start = 0
+            return False
         
         return True
     
@@ -318,18 +622,28 @@ class LowMemorySymSpell:
         max_dictionary_edit_distance: Max edit distance for lookups
         prefix_length: Length of word prefixes for spell checking
         data_dir: Directory for mmap files (uses temp if None)
+        build_workers: Worker processes used to generate delete variants
+            when building from a dictionary (1 = in-process)
     """
     
+    READ_CHUNK_SIZE = 1 << 20  # Dictionary files are streamed in 1 MB chunks
+    
+    # Characters that text mode treats as whitespace or line breaks but a
+    # bytes-level split does not (\r, \x1c-\x1f, NBSP, other Unicode spaces)
+    TEXT_ONLY_WHITESPACE = re.compile(r"[^\S \t\n\x0b\x0c]")
+    
     def __init__(
         self,
         memory_limit_mb: float = 50.0,
         max_dictionary_edit_distance: int = 2,
         prefix_length: int = 7,
         data_dir: Optional[str] = None,
+        build_workers: int = 1,
     ):
         self.memory_limit_mb = memory_limit_mb
         self.max_edit_distance = max_dictionary_edit_distance
         self.prefix_length = prefix_length
+        self.build_workers = max(1, build_workers)
         
         # Create data directory
         if data_dir is None:
@@ -403,21 +717,9 @@ class LowMemorySymSpell:
             return False
         
         # Read all words
-        words_list: list[tuple[str, int]] = []
-        
-        with open(corpus_path, "r", encoding=encoding) as f:
-            for line in f:
-                parts = line.rstrip().split(separator)
-                if len(parts) < 2:
-                    continue
-                
-                term = parts[term_index]
-                try:
-                    count = int(parts[count_index])
-                except ValueError:
-                    continue
-                
-                words_list.append((term, count))
+        words_list = self._read_term_counts(
+            corpus_path, term_index, count_index, separator, encoding
+        )
         
         # Build words mmap (sorted)
         words_list.sort(key=lambda x: x[0])
@@ -425,55 +727,181 @@ class LowMemorySymSpell:
         self.words.open()
         self.word_count = self.words.num_words
         
-        # Build deletes index
-        deletes_dict: dict[str, list[int]] = {}
-        
-        for idx, (term, _) in enumerate(words_list):
-            # Add empty string for short words
-            if len(term) <= self.max_edit_distance:
-                if "" not in deletes_dict:
-                    deletes_dict[""] = []
-                deletes_dict[""].append(idx)
-            
-            # Generate deletes from prefix
-            prefix = term[:self.prefix_length] if len(term) > self.prefix_length else term
-            deletes = self._generate_deletes(prefix, 0, set())
-            deletes.add(prefix)
-            
-            for delete in deletes:
-                if delete not in deletes_dict:
-                    deletes_dict[delete] = []
-                deletes_dict[delete].append(idx)
+        # Build deletes index as flat (key, word_id) arrays
+        delete_pairs = self._build_delete_pairs(words_list)
         
         # Free words_list - no longer needed
         del words_list
         
-        # Build deletes mmap
-        self.deletes.build(deletes_dict)
+        # Build deletes mmap (takes the arrays out of delete_pairs and frees
+        # them as it goes)
+        self.deletes.build(delete_pairs)
         self.deletes.open()
         
-        # Free deletes_dict - no longer needed
-        del deletes_dict
-        
         # Force garbage collection to reclaim memory
         gc.collect()
         
         return True
     
-    def _generate_deletes(self, word: str, edit_distance: int, deletes: set) -> set:
-        """Generate all deletes within edit distance."""
-        edit_distance += 1
-        if not word:
-            return deletes
+    @staticmethod
+    def _is_ascii_compatible(encoding: str) -> bool:
+        """True if newlines and ASCII separators encode to the same single bytes."""
+        return "\n \t".encode(encoding) == b"\n \t"
+    
+    def _iter_line_parts(
+        self, corpus_path: Path, separator: Optional[str], encoding: str
+    ):
+        """
+        Yield the fields of each line of a text file as bytes.
+        
+        Lines and fields are split exactly as when reading the file in text
+        mode and calling line.rstrip().split(separator); a separator of None
+        splits on runs of whitespace.
+        
+        For ASCII-compatible encodings the file is streamed as raw bytes in
+        1 MB chunks. Each chunk's complete lines are decoded once to validate
+        them, and unless they contain whitespace that only text mode
+        recognizes (see TEXT_ONLY_WHITESPACE) they are split at the bytes
+        level, so no per-line strings are made and the fields stay in the
+        file's encoding. Other encodings (UTF-16, UTF-8 with BOM, ...) are
+        read in text mode and the fields are re-encoded as UTF-8; see
+        _field_encoding().
+        """
+        if not self._is_ascii_compatible(encoding):
+            with open(corpus_path, "r", encoding=encoding) as f:
+                for line in f:
+                    yield [part.encode("utf-8") for part in line.rstrip().split(separator)]
+            return
+        
+        sep = None if separator is None else separator.encode(encoding)
+        with open(corpus_path, "rb") as f:
+            tail = b""
+            while True:
+                chunk = f.read(self.READ_CHUNK_SIZE)
+                if chunk:
+                    # Last line may be partial - carry it over
+                    body, _, tail = (tail + chunk).rpartition(b"\n")
+                else:
+                    body, tail = tail, b""
+                
+                if body:
+                    text = body.decode(encoding)
+                    if self.TEXT_ONLY_WHITESPACE.search(text) is None:
+                        for line in body.split(b"\n"):
+                            yield line.rstrip().split(sep)
+                    else:
+                        # Universal newlines: \r and \r\n end a line too
+                        for line in re.split(r"\r\n?|\n", text):
+                            yield [
+                                part.encode(encoding)
+                                for part in line.rstrip().split(separator)
+                            ]
+                
+                if not chunk:
+                    break
+    
+    def _field_encoding(self, encoding: str) -> str:
+        """Encoding of the fields yielded by _iter_line_parts() for a file encoding."""
+        return encoding if self._is_ascii_compatible(encoding) else "utf-8"
+    
+    def _read_term_counts(
+        self,
+        corpus_path: Path,
+        term_index: int,
+        count_index: int,
+        separator: str,
+        encoding: Optional[str],
+    ) -> list[tuple[str, int]]:
+        """
+        Read (term, count) pairs from a frequency dictionary file.
+        
+        Only the term field is decoded; counts are parsed straight from bytes.
+        """
+        words_list: list[tuple[str, int]] = []
+        encoding = encoding or "utf-8"
+        field_encoding = self._field_encoding(encoding)
+        
+        for parts in self._iter_line_parts(corpus_path, separator, encoding):
+            if len(parts) < 2:
+                continue
+            
+            try:
+                count = int(parts[count_index])
+            except (ValueError, IndexError):
+                continue
+            
+            words_list.append((parts[term_index].decode(field_encoding), count))
+        
+        return words_list
+    
+    def _build_delete_pairs(
+        self, words_list: list[tuple[str, int]]
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        Generate (delete_key, word_index) pairs for every word.
         
-        for i in range(len(word)):
-            delete = word[:i] + word[i + 1:]
-            if delete not in deletes:
-                deletes.add(delete)
-                if edit_distance < self.max_edit_distance:
-                    self._generate_deletes(delete, edit_distance, deletes)
+        Returns the narrow and wide key partitions from
+        _partition_delete_pairs(), each a tuple of flat parallel arrays
+        (fixed-width UTF-8 keys and uint32 word indices) in no particular
+        order, ready to be handed over to MMapDeletes.build().
+        """
+        # Fixed-width array assignment truncates each term to its prefix,
+        # so no per-word prefix string is ever created
+        prefixes = np.fromiter(
+            (term for term, _ in words_list),
+            dtype=f'U{self.prefix_length}',
+            count=len(words_list),
+        )
+        if self.build_workers > 1 and len(prefixes) > self.build_workers:
+            key_blocks, id_blocks = self._generate_delete_pairs_parallel(prefixes)
+        else:
+            key_blocks, id_blocks = _generate_delete_pairs(prefixes, self.max_edit_distance)
         
-        return deletes
+        # Add empty string for short words
+        short_ids = np.array(
+            [idx for idx, (term, _) in enumerate(words_list)
+             if len(term) <= self.max_edit_distance],
+            dtype='<u4',
+        )
+        key_blocks.append(np.zeros(len(short_ids), dtype='S1'))
+        id_blocks.append(short_ids)
+        return _partition_delete_pairs(key_blocks, id_blocks, self.prefix_length)
+    
+    def _generate_delete_pairs_parallel(
+        self, prefixes: np.ndarray
+    ) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """
+        Generate delete pairs across worker processes.
+        
+        The prefixes are split into one contiguous shard per worker; each
+        shard's word indices are shifted back to global indices and the
+        shards' blocks are returned together (the caller partitions them).
+        """
+        shard_size = -(-len(prefixes) // self.build_workers)
+        starts = range(0, len(prefixes), shard_size)
+        
+        with ProcessPoolExecutor(max_workers=self.build_workers) as pool:
+            futures = [
+                pool.submit(
+                    _generate_delete_pairs,
+                    prefixes[start:start + shard_size],
+                    self.max_edit_distance,
+                )
+                for start in starts
+            ]
+            shards = [future.result() for future in futures]
+        
+        key_blocks: list[np.ndarray] = []
+        id_blocks: list[np.ndarray] = []
+        for start, (shard_keys, shard_ids) in zip(starts, shards):
+            for ids in shard_ids:
+                ids += np.uint32(start)
+            key_blocks += shard_keys
+            id_blocks += shard_ids
+        
+        # The blocks are now only referenced from the returned lists
+        del shards
+        return key_blocks, id_blocks
     
     def load_dictionary_top_n(
         self,
@@ -495,21 +923,9 @@ class LowMemorySymSpell:
             return False
         
         # Read all words with counts
-        words_list: list[tuple[str, int]] = []
-        
-        with open(corpus_path, "r", encoding=encoding) as f:
-            for line in f:
-                parts = line.rstrip().split(separator)
-                if len(parts) < 2:
-                    continue
-                
-                term = parts[term_index]
-                try:
-                    count = int(parts[count_index])
-                except ValueError:
-                    continue
-                
-                words_list.append((term, count))
+        words_list = self._read_term_counts(
+            corpus_path, term_index, count_index, separator, encoding
+        )
         
         # Sort by count descending and take top N
         words_list.sort(key=lambda x: -x[1])
@@ -524,29 +940,13 @@ class LowMemorySymSpell:
         self.word_count = self.words.num_words
         
         # Build deletes index
-        deletes_dict: dict[str, list[int]] = {}
-        
-        for idx, (term, _) in enumerate(words_list):
-            if len(term) <= self.max_edit_distance:
-                if "" not in deletes_dict:
-                    deletes_dict[""] = []
-                deletes_dict[""].append(idx)
-            
-            prefix = term[:self.prefix_length] if len(term) > self.prefix_length else term
-            deletes = self._generate_deletes(prefix, 0, set())
-            deletes.add(prefix)
-            
-            for delete in deletes:
-                if delete not in deletes_dict:
-                    deletes_dict[delete] = []
-                deletes_dict[delete].append(idx)
+        delete_pairs = self._build_delete_pairs(words_list)
         
         del words_list
         
-        self.deletes.build(deletes_dict)
+        self.deletes.build(delete_pairs)
         self.deletes.open()
         
-        del deletes_dict
         gc.collect()
         
         return True
@@ -564,33 +964,45 @@ class LowMemorySymSpell:
         if not corpus_path.exists():
             return False
         
-        bigrams_list: list[tuple[str, int]] = []
+        keys: list[bytes] = []
+        counts: list[int] = []
         min_parts = 3 if separator is None else 2
+        encoding = encoding or "utf-8"
+        field_encoding = self._field_encoding(encoding)
         
-        with open(corpus_path, "r", encoding=encoding) as f:
-            for line in f:
-                parts = line.rstrip().split(separator)
-                if len(parts) < min_parts:
-                    continue
-                
-                try:
-                    count = int(parts[count_index])
-                except ValueError:
-                    continue
-                
-                if separator is None:
-                    key = f"{parts[term_index]} {parts[term_index + 1]}"
-                else:
-                    key = parts[term_index]
-                
-                bigrams_list.append((key, count))
+        for parts in self._iter_line_parts(corpus_path, separator, encoding):
+            if len(parts) < min_parts:
+                continue
+            
+            try:
+                count = int(parts[count_index])
+            except (ValueError, IndexError):
+                continue
+            
+            if separator is None:
+                key = parts[term_index] + b" " + parts[term_index + 1]
+            else:
+                key = parts[term_index]
+            
+            keys.append(key)
+            counts.append(count)
+        
+        # Keys are stored as UTF-8 (_iter_line_parts has already rejected
+        # input that is invalid in its encoding)
+        if codecs.lookup(field_encoding).name != "utf-8":
+            keys = [key.decode(field_encoding).encode("utf-8") for key in keys]
+        
+        key_array = np.array(keys, dtype='S')
+        del keys
+        count_array = np.array(counts, dtype='<u8')
+        del counts
         
-        self.bigrams.build(bigrams_list)
+        self.bigrams.build_arrays(key_array, count_array)
         self.bigrams.open()
         self.bigram_count = self.bigrams.num_words
         
-        # Free bigrams_list
-        del bigrams_list
+        # Free bigram arrays
+        del key_array, count_array
         gc.collect()
         
         return True